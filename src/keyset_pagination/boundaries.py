@@ -0,0 +1,178 @@
+"""
+An index of page boundaries for a KeysetPaginator. This makes it possible to
+turn an integer page number into a key, and then fetch that page using a normal
+seek, rather than an OFFSET.
+
+The index is stored in the django cache, keyed on the database, the SQL of the
+queryset and the page size, so it may be shared between requests (and built or refreshed
+outside of the request cycle).
+"""
+
+import hashlib
+import json
+
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, InvalidPage
+
+
+class PageBoundaries(object):
+    """
+    Keep the key of the last object on each page, so that page N may be fetched
+    by seeking past the key of the last object on page N - 1.
+
+    The index is built with a single walk over the queryset, by `refresh()`. This
+    will not happen during a request unless `build_on_miss` is set: until then, the
+    paginator behaves as if there was no index. Loading the index only reads from
+    the cache, so new objects will not have page numbers until `refresh()` is called
+    again, which extends it from the last known boundary: this is only correct when
+    new objects sort after the existing ones (ie, they are appended). If objects are
+    inserted elsewhere, or removed, you'll need to `invalidate()` it.
+
+    The boundaries are stored in chunks of `chunk_size`, so that no single cache
+    entry gets too large (memcached defaults to a 1MB limit), and looking up a page
+    only needs to fetch one chunk.
+    """
+    cache_alias = 'default'
+    timeout = None
+    chunk_size = 1000
+    build_on_miss = False
+
+    def __init__(self, paginator):
+        self.paginator = paginator
+        self._header = None
+        self._loaded = False
+
+        queryset = paginator.object_list
+        try:
+            sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+        except EmptyResultSet:
+            # This queryset can never match anything, so we never need to store an index.
+            self.cache_key = None
+        else:
+            fingerprint = json.dumps([queryset.db, sql, params, paginator.per_page], default=str)
+            self.cache_key = 'keyset_pagination:boundaries:{}'.format(
+                hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+            )
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _chunk_key(self, chunk):
+        return '{}:{}'.format(self.cache_key, chunk)
+
+    @property
+    def header(self):
+        "The length of the index, and the number of objects after the last boundary: None if not built."
+        if not self._loaded:
+            if self.cache_key is None:
+                self.refresh()
+            else:
+                self._header = self.cache.get(self.cache_key)
+                if self._header is None and self.build_on_miss:
+                    self.refresh()
+            self._loaded = True
+        return self._header
+
+    def refresh(self):
+        "Extend the index with any objects after the last known boundary, building it if necessary."
+        if self.cache_key is None:
+            self._header = {'length': 0, 'trailing': 0}
+        else:
+            self._refresh(self.cache.get(self.cache_key))
+        self._loaded = True
+
+    def _refresh(self, header):
+        # pylint: disable=protected-access
+        paginator = self.paginator
+        cached = header
+        first_chunk = 0
+        boundaries = []
+
+        # We only need to rewrite the last chunk (and any that follow it), but all
+        # of them must still be present.
+        if header and header['length']:
+            first_chunk = (header['length'] - 1) // self.chunk_size
+            chunk_keys = [self._chunk_key(chunk) for chunk in range(first_chunk + 1)]
+            chunks = self.cache.get_many(chunk_keys)
+            boundaries = chunks.get(chunk_keys[-1]) if len(chunks) == len(chunk_keys) else None
+        if not header or boundaries is None:
+            # Part of the index has been evicted: we need to start again.
+            cached = None
+            header = {'length': 0, 'trailing': 0}
+            first_chunk = 0
+            boundaries = []
+
+        queryset = paginator.object_list.order_by(*paginator.keys)
+        if boundaries:
+            queryset = queryset.filter(paginator._get_page_filters([False] + boundaries[-1]))
+
+        # We only need the key values, and we don't want to hold every row in memory.
+        # Passing them through JSON ensures we store exactly what would be in a
+        # next_page_number() key.
+        index = 0
+        values_list = queryset.values_list(*[key.lstrip('-') for key in paginator.keys])
+        for index, values in enumerate(values_list.iterator(), 1):
+            if index % paginator.per_page == 0:
+                boundaries.append(json.loads(json.dumps(list(values), default=str)))
+
+        self._header = {
+            'length': first_chunk * self.chunk_size + len(boundaries),
+            'trailing': index % paginator.per_page,
+        }
+        if self._header == cached:
+            return
+
+        self.cache.set_many({
+            self._chunk_key(first_chunk + i // self.chunk_size): boundaries[i:i + self.chunk_size]
+            for i in range(0, len(boundaries), self.chunk_size)
+        }, self.timeout)
+        # The header is written last, so it never refers to chunks that don't exist.
+        self.cache.set(self.cache_key, self._header, self.timeout)
+
+    def invalidate(self):
+        "Discard the index: it will not be used until it is rebuilt."
+        if self.cache_key is not None:
+            header = self.cache.get(self.cache_key)
+            self.cache.delete(self.cache_key)
+            if header:
+                self.cache.delete_many([
+                    self._chunk_key(chunk)
+                    for chunk in range((header['length'] + self.chunk_size - 1) // self.chunk_size)
+                ])
+        self._header = None
+        self._loaded = False
+
+    @property
+    def count(self):
+        if self.header is None:
+            return None
+        return self.header['length'] * self.paginator.per_page + self.header['trailing']
+
+    @property
+    def num_pages(self):
+        if self.header is None:
+            return None
+        if not self.count:
+            return 1 if self.paginator.allow_empty_first_page else 0
+        return self.header['length'] + (1 if self.header['trailing'] else 0)
+
+    def key(self, number):
+        "Turn an integer page number into a key suitable for KeysetPaginator.page()."
+        if self.header is None:
+            raise InvalidPage('Page numbers are not available')
+        if number < 1:
+            raise EmptyPage('That page number is less than 1')
+        if number > self.num_pages:
+            raise EmptyPage('That page contains no results')
+        if number == 1:
+            return None
+
+        index = number - 2
+        chunk = self.cache.get(self._chunk_key(index // self.chunk_size))
+        if chunk is None:
+            # Part of the index has been evicted: stop using it until it is rebuilt.
+            self.invalidate()
+            raise InvalidPage('Page numbers are not available')
+        return [False] + chunk[index % self.chunk_size]
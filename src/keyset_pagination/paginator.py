@@ -11,7 +11,10 @@ from functools import reduce
 from operator import and_, or_
 
 from django.core.paginator import InvalidPage, Page, Paginator
-from django.db import models
+from django.db import connections, models
+from django.db.models.constants import LOOKUP_SEP
+
+from .boundaries import PageBoundaries
 
 try:
     text = (unicode, str)   # NOQA
@@ -50,9 +53,16 @@ def attr_getter(instance, key):
 
 
 class KeysetPaginator(Paginator):
-    "Keyset Pagination: does not use OFFSET."
+    """
+    Keyset Pagination: does not use OFFSET.
+
+    If `boundaries` is true, an index of page boundaries is kept (see
+    `keyset_pagination.boundaries.PageBoundaries`), and integer page numbers,
+    count, num_pages and page_range are all supported.
+    """
+    boundaries_class = PageBoundaries
 
-    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True):
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, boundaries=False):
         if object_list == [] or object_list is None:
             self.keys = ['pk']
         else:
@@ -64,7 +74,12 @@ class KeysetPaginator(Paginator):
             )
         super(KeysetPaginator, self).__init__(object_list, per_page, orphans, allow_empty_first_page)
 
-    def _get_page_filters(self, number):
+        if boundaries and isinstance(object_list, models.QuerySet):
+            self.boundaries = self.boundaries_class(self)
+        else:
+            self.boundaries = None
+
+    def _get_page_filters(self, number, include=False):
         # The first part of our key is always the "previous" link indicator. If this
         # value is true, that means this is a previous link, so we need to reverse all
         # of the tests and the ordering later.
@@ -77,6 +92,10 @@ class KeysetPaginator(Paginator):
             build_filter(key, value, flip=flip)
             for key, value in zip(self.keys, values)
         ]
+        # If we want to include the row that exactly matches our key (for instance,
+        # the anchor of page_around), then the final tie-breaker needs to be lte/gte.
+        if include:
+            key_filters[-1] = build_filter(self.keys[-1], values[-1], include=True, flip=flip)
         # And these are the filters that detect a tie at each level.
         equality_filters = [
             models.Q(**{
@@ -116,15 +135,96 @@ class KeysetPaginator(Paginator):
 
     def page(self, number):
         number = self.validate_number(number)
+        page_index = None
 
-        if number is None or not self.object_list:
+        # Integer page numbers are turned into a key using our page boundary index.
+        if isinstance(number, int):
+            page_index, number = number, self.boundaries.key(number)
+        elif number is None and self.num_pages:
+            page_index = 1
+
+        # Testing the truthiness of a queryset would fetch every row.
+        if number is None or not isinstance(self.object_list, models.QuerySet):
             object_list = self.object_list
         else:
             object_list = self.object_list.filter(
                 self._get_page_filters(number)
             ).order_by(*self._get_ordering(number))
 
-        return self._get_page(object_list[:self.per_page + 1], number, self)
+        return self._get_page(object_list[:self.per_page + 1], number, self, page_index=page_index)
+
+    def page_around(self, anchor, before=None, after=None):
+        """
+        Fetch the page containing `anchor`, which may be a model instance or a
+        page number (as returned by next_page_number/previous_page_number), whose
+        key values will be used.
+
+        The page will contain up to `before` objects preceding the anchor, the
+        anchor itself, and up to `after` objects following it: by default these
+        are chosen so the page is `per_page` long.
+
+        Where the database supports it, both seeks are performed as a single
+        UNION ALL query. This is not possible when any of the ordering keys
+        follow a relation.
+
+        Integer page numbers (from a page boundary index) are not valid anchors.
+        """
+        if before is None:
+            before = (self.per_page - 1) // 2
+        if after is None:
+            after = self.per_page - 1 - before
+        if before < 0 or after < 0:
+            raise ValueError('before and after must not be negative.')
+
+        if isinstance(anchor, models.Model):
+            values = [attr_getter(anchor, key) for key in self.keys]
+        else:
+            number = self.validate_number(anchor)
+            if not isinstance(number, list):
+                raise InvalidPage('Invalid key')
+            values = number[1:]
+
+        if not isinstance(self.object_list, models.QuerySet):
+            return self.page(None)
+
+        # We fetch one extra object in each direction, so we can tell if there
+        # are more objects beyond this page.
+        preceding = self.object_list.filter(
+            self._get_page_filters([True] + values)
+        ).order_by(*self._get_ordering([True]))[:before + 1]
+        following = self.object_list.filter(
+            self._get_page_filters([False] + values, include=True)
+        ).order_by(*self.keys)[:after + 2]
+
+        # A UNION can only be ordered by the columns it selects, so we can't use
+        # it if a key follows a relation.
+        features = connections[self.object_list.db].features
+
+        if features.supports_slicing_ordering_in_compound and not any(LOOKUP_SEP in key for key in self.keys):
+            # The ordering of each part of a UNION is not preserved, so we need to
+            # tag which side each object came from, and have the database order
+            # the combined results (its ordering may not match python's).
+            objects = list(preceding.annotate(
+                _keyset_preceding=models.Value(True, output_field=models.BooleanField())
+            ).union(following.annotate(
+                _keyset_preceding=models.Value(False, output_field=models.BooleanField())
+            ), all=True).order_by('-_keyset_preceding', *self.keys))
+            preceding = [obj for obj in objects if obj._keyset_preceding]
+            following = [obj for obj in objects if not obj._keyset_preceding]
+            # The objects should be the same, whichever way we fetched them.
+            for obj in objects:
+                del obj._keyset_preceding
+        else:
+            preceding = list(reversed(preceding))
+            following = list(following)
+
+        object_list = preceding[max(len(preceding) - before, 0):] + following[:after + 1]
+
+        return KeysetWindowPage(
+            object_list, [False] + values, self,
+            has_previous=bool(object_list) and len(preceding) > before,
+            has_next=len(following) > after + 1,
+        )
 
     def validate_number(self, number):
         if isinstance(number, text):
@@ -134,6 +234,10 @@ class KeysetPaginator(Paginator):
                 raise InvalidPage('Invalid key')
         if not number or number == 1:
             return None
+        if isinstance(number, int) and not isinstance(number, bool) and self.boundaries is not None:
+            # This will be resolved to a key when we fetch the page, as it may be
+            # out of range.
+            return number
         if not isinstance(number, list):
             raise InvalidPage('Invalid key')
         if len(number) != 1 + len(self.keys):
@@ -142,14 +246,20 @@ class KeysetPaginator(Paginator):
 
     @property
     def count(self):
+        if self.boundaries is not None:
+            return self.boundaries.count
         return None
 
     @property
     def num_pages(self):
+        if self.boundaries is not None:
+            return self.boundaries.num_pages
         return None
 
     @property
     def page_range(self):
+        if self.num_pages is not None:
+            return range(1, self.num_pages + 1)
         return []
 
 
@@ -157,7 +267,7 @@ class KeysetPage(Page):
     "Custom Page for KeysetPaginator"
     # pylint: disable=too-many-ancestors
 
-    def __init__(self, object_list, number, paginator):
+    def __init__(self, object_list, number, paginator, page_index=None):
         # We can't call our ancestor's __init__, because that will set
         # self.object_list, which we don't want to set.
         # pylint: disable=super-init-not-called
@@ -165,6 +275,7 @@ class KeysetPage(Page):
         self.number = number
         self.direction = 'previous' if number and number[0] else 'next'
         self.paginator = paginator
+        self._page_index = page_index
         self._continues = None
 
     def __repr__(self):
@@ -174,8 +285,8 @@ class KeysetPage(Page):
 
     @property
     def page_index(self):
-        "The page_index of a keyset page is always None."
-        return None
+        "The page_index of a keyset page is None, unless it was fetched using a page boundary index."
+        return self._page_index
 
     @property
     def continues(self):
@@ -232,11 +343,15 @@ class KeysetPage(Page):
 
     def next_page_number(self):
         if self.has_next():
+            if self.page_index is not None:
+                return self.page_index + 1
             return self._key_for_instance(self[-1])
         return None
 
     def previous_page_number(self):
         if self.has_previous():
+            if self.page_index is not None:
+                return self.page_index - 1
             return self._key_for_instance(self[0], True)
         return None
 
@@ -245,3 +360,24 @@ class KeysetPage(Page):
 
     def end_index(self):
         return None
+
+
+class KeysetWindowPage(KeysetPage):
+    "A KeysetPage centred on an anchor object, as returned by KeysetPaginator.page_around()"
+    # pylint: disable=too-many-ancestors
+
+    def __init__(self, object_list, number, paginator, has_previous, has_next):
+        super(KeysetWindowPage, self).__init__(object_list, number, paginator)
+        self._has_previous = has_previous
+        self._continues = self._has_next = has_next
+
+    @property
+    def object_list(self):  # NOQA
+        # We have already trimmed and ordered our objects.
+        return self._object_list
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
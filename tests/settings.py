@@ -13,7 +13,8 @@ INSTALLED_APPS = [
 
 
 DATABASES = {
-    "default": dj_database_url.config(conn_max_age=600)
+    "default": dj_database_url.config(conn_max_age=600),
+    "other": dict(dj_database_url.config(conn_max_age=600), TEST={"MIRROR": "default"}),
 }
 
 ROOT_URLCONF = 'tests.urls'
@@ -0,0 +1,194 @@
+import pytest
+
+from django.core.cache import caches
+
+from keyset_pagination.boundaries import PageBoundaries
+from keyset_pagination.paginator import KeysetPaginator, InvalidPage
+
+from ..models import Event
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    caches['default'].clear()
+
+
+@pytest.fixture
+def events():
+    Event.objects.bulk_create([
+        Event(timestamp='2017-01-01T01:23:45Z', group="bar", reading=2),
+        Event(timestamp='2017-01-01T01:23:45Z', group="baz", reading=3),
+        Event(timestamp='2017-01-01T01:23:45Z', group="foo", reading=1),
+        Event(timestamp='2017-01-01T01:23:45Z', group="qux", reading=4),
+        Event(timestamp='2017-01-01T05:23:45Z', group="foo", reading=5),
+        Event(timestamp='2017-01-01T06:23:45Z', group="foo", reading=6),
+    ])
+
+
+def indexed_paginator(queryset, per_page):
+    paginator = KeysetPaginator(queryset, per_page, boundaries=True)
+    paginator.boundaries.refresh()
+    return paginator
+
+
+def test_numbered_pages(events):
+    paginator = indexed_paginator(Event.objects.order_by('timestamp', 'group'), 2)
+    assert paginator.count == 6
+    assert paginator.num_pages == 3
+    assert list(paginator.page_range) == [1, 2, 3]
+
+    assert [2, 3] == [x.reading for x in paginator.page(1).object_list]
+    assert [1, 4] == [x.reading for x in paginator.page(2).object_list]
+    assert [5, 6] == [x.reading for x in paginator.page('3').object_list]
+
+    page = paginator.page(2)
+    assert page.page_index == 2
+    assert page.next_page_number() == 3
+    assert page.previous_page_number() == 1
+    assert repr(page) == '<KeysetPage: 2 of 3>'
+
+    page = paginator.page(1)
+    assert page.page_index == 1
+    assert page.next_page_number() == 2
+    assert not page.has_previous()
+
+
+def test_page_out_of_range(events):
+    paginator = indexed_paginator(Event.objects.order_by('timestamp', 'group'), 4)
+    with pytest.raises(InvalidPage):
+        paginator.page(3)
+
+    with pytest.raises(InvalidPage):
+        paginator.page(-1)
+
+
+def test_index_is_not_built_during_request(events, django_assert_num_queries):
+    paginator = KeysetPaginator(Event.objects.order_by('timestamp', 'group'), 2, boundaries=True)
+    with django_assert_num_queries(0):
+        assert paginator.num_pages is None
+        assert paginator.page_range == []
+
+    with pytest.raises(InvalidPage):
+        paginator.page(2)
+
+    class Boundaries(PageBoundaries):
+        build_on_miss = True
+
+    class Paginator(KeysetPaginator):
+        boundaries_class = Boundaries
+
+    assert Paginator(Event.objects.order_by('timestamp', 'group'), 2, boundaries=True).num_pages == 3
+
+
+def test_index_is_shared_and_extended(events, django_assert_num_queries):
+    queryset = Event.objects.order_by('timestamp', 'group')
+    indexed_paginator(queryset, 4)
+
+    paginator = KeysetPaginator(queryset, 4, boundaries=True)
+    assert paginator.num_pages == 2
+    with django_assert_num_queries(1):
+        assert [5, 6] == [x.reading for x in paginator.page(2).object_list]
+
+    Event.objects.bulk_create([
+        Event(timestamp='2017-01-01T07:23:45Z', group=group, reading=i) for i, group in enumerate('abcde', 7)
+    ])
+    # Loading the index in a request doesn't touch the database.
+    paginator = KeysetPaginator(queryset, 4, boundaries=True)
+    with django_assert_num_queries(0):
+        assert paginator.num_pages == 2
+    with pytest.raises(InvalidPage):
+        paginator.page(3)
+
+    paginator.boundaries.refresh()
+    paginator = KeysetPaginator(queryset, 4, boundaries=True)
+    assert paginator.num_pages == 3
+    assert paginator.count == 11
+    assert [9, 10, 11] == [x.reading for x in paginator.page(3).object_list]
+
+
+def test_index_is_chunked(events):
+    class Boundaries(PageBoundaries):
+        chunk_size = 2
+
+    class Paginator(KeysetPaginator):
+        boundaries_class = Boundaries
+
+    queryset = Event.objects.order_by('timestamp', 'group')
+    paginator = Paginator(queryset, 1, boundaries=True)
+    paginator.boundaries.refresh()
+    assert paginator.num_pages == 6
+    assert [[x.reading for x in paginator.page(i).object_list] for i in paginator.page_range] == [
+        [2], [3], [1], [4], [5], [6],
+    ]
+
+    # Losing a chunk means we can't use the index until it is rebuilt.
+    caches['default'].delete(paginator.boundaries._chunk_key(0))
+    paginator = Paginator(queryset, 1, boundaries=True)
+    with pytest.raises(InvalidPage):
+        paginator.page(2)
+    paginator = Paginator(queryset, 1, boundaries=True)
+    assert paginator.num_pages is None
+    assert paginator.page_range == []
+
+    paginator.boundaries.refresh()
+    assert paginator.num_pages == 6
+    assert [3] == [x.reading for x in paginator.page(2).object_list]
+
+    # A refresh notices any missing chunk, not just the last one.
+    caches['default'].delete(paginator.boundaries._chunk_key(0))
+    paginator = Paginator(queryset, 1, boundaries=True)
+    paginator.boundaries.refresh()
+    assert [[x.reading for x in paginator.page(i).object_list] for i in paginator.page_range] == [
+        [2], [3], [1], [4], [5], [6],
+    ]
+
+
+def test_index_is_per_database(events):
+    queryset = Event.objects.order_by('timestamp', 'group')
+    indexed_paginator(queryset, 2)
+    assert KeysetPaginator(queryset, 2, boundaries=True).num_pages == 3
+    assert KeysetPaginator(queryset.using('other'), 2, boundaries=True).num_pages is None
+
+
+def test_invalidate(events):
+    queryset = Event.objects.order_by('-timestamp', 'group')
+    paginator = indexed_paginator(queryset, 4)
+    assert [1, 4] == [x.reading for x in paginator.page(2).object_list]
+
+    Event.objects.create(timestamp='2017-01-01T07:23:45Z', group="foo", reading=7)
+    paginator.boundaries.invalidate()
+    assert paginator.num_pages is None
+    assert caches['default'].get(paginator.boundaries._chunk_key(0)) is None
+
+    paginator.boundaries.refresh()
+    assert [3, 1, 4] == [x.reading for x in paginator.page(2).object_list]
+
+
+@pytest.mark.parametrize('queryset', [
+    Event.objects.none().order_by('timestamp', 'pk'),
+    Event.objects.filter(pk__in=[]).order_by('timestamp', 'pk'),
+])
+def test_queryset_that_cannot_match(events, queryset):
+    paginator = KeysetPaginator(queryset, 10, boundaries=True)
+    assert paginator.count == 0
+    assert paginator.num_pages == 1
+    assert paginator.page(1).object_list == []
+    with pytest.raises(InvalidPage):
+        paginator.page(2)
+
+
+def test_empty_first_page_not_allowed():
+    paginator = KeysetPaginator(
+        Event.objects.order_by('timestamp', 'group'), 2, allow_empty_first_page=False, boundaries=True,
+    )
+    paginator.boundaries.refresh()
+    assert paginator.num_pages == 0
+    assert paginator.page(1).page_index is None
+
+
+def test_no_index_without_boundaries(events):
+    paginator = KeysetPaginator(Event.objects.order_by('timestamp', 'group'), 2)
+    assert paginator.num_pages is None
+    assert paginator.page_range == []
+    with pytest.raises(InvalidPage):
+        paginator.page(2)
@@ -1,5 +1,7 @@
 import pytest
 
+from django.db import connection
+
 from keyset_pagination.paginator import KeysetPaginator, InvalidPage
 
 from ..models import Event, Location
@@ -51,6 +53,13 @@ def test_paginator_multiple_pages():
     assert page.object_list[0].reading == 1
 
 
+def test_paginator_page_is_a_single_query(events, django_assert_num_queries):
+    paginator = KeysetPaginator(Event.objects.order_by('timestamp', 'group'), 2)
+    number = paginator.page(1).next_page_number()
+    with django_assert_num_queries(1):
+        assert [1, 4] == [x.reading for x in paginator.page(number).object_list]
+
+
 def test_paginator_multiple_ordering_columns(events):
     paginator = KeysetPaginator(Event.objects.order_by('timestamp', 'group'), 3)
     page = paginator.page(1)
@@ -139,3 +148,106 @@ def test_invalid_page_number(events):
 
     with pytest.raises(InvalidPage):
         paginator.page('[2,true')
+
+
+def test_page_around_instance(events):
+    paginator = KeysetPaginator(Event.objects.order_by('timestamp', 'group'), 3)
+    anchor = Event.objects.get(reading=1)
+    page = paginator.page_around(anchor)
+    assert [3, 1, 4] == [x.reading for x in page.object_list]
+    assert page.has_previous()
+    assert page.has_next()
+
+    page = paginator.page(page.previous_page_number())
+    assert [2] == [x.reading for x in page.object_list]
+
+    page = paginator.page(paginator.page_around(anchor).next_page_number())
+    assert [5, 6] == [x.reading for x in page.object_list]
+
+
+def test_page_around_key(events):
+    paginator = KeysetPaginator(Event.objects.order_by('timestamp', 'group'), 3)
+    page = paginator.page_around('[false, "2017-01-01 01:23:45+00:00", "foo"]', before=2, after=0)
+    assert [2, 3, 1] == [x.reading for x in page.object_list]
+    assert not page.has_previous()
+    assert page.has_next()
+
+
+def test_page_around_boundaries(events):
+    paginator = KeysetPaginator(Event.objects.order_by('-timestamp', 'group'), 10)
+    page = paginator.page_around(Event.objects.get(reading=6), before=2, after=2)
+    assert [6, 5, 2] == [x.reading for x in page.object_list]
+    assert not page.has_previous()
+    assert page.has_next()
+
+    page = paginator.page_around(Event.objects.get(reading=4), before=2, after=2)
+    assert [3, 1, 4] == [x.reading for x in page.object_list]
+    assert page.has_previous()
+    assert not page.has_next()
+
+
+def test_page_around_invalid_key(events):
+    paginator = KeysetPaginator(Event.objects.order_by('timestamp', 'group'), 3)
+    with pytest.raises(InvalidPage):
+        paginator.page_around('1')
+
+    with pytest.raises(InvalidPage):
+        paginator.page_around('[false, "2017-01-01 01:23:45+00:00"]')
+
+
+def test_page_around_invalid_window(events):
+    paginator = KeysetPaginator(Event.objects.order_by('timestamp', 'group'), 3)
+    with pytest.raises(ValueError):
+        paginator.page_around(Event.objects.get(reading=1), before=-1)
+
+
+def test_page_around_integer_anchor(events):
+    paginator = KeysetPaginator(Event.objects.order_by('timestamp', 'group'), 2, boundaries=True)
+    paginator.boundaries.refresh()
+    with pytest.raises(InvalidPage):
+        paginator.page_around(2)
+
+
+def test_page_around_lookup_keys():
+    location = Location.objects.create(name='A')
+    Event.objects.bulk_create([
+        Event(timestamp='2019-01-01T01:02:03Z', reading=i, location=location) for i in range(5)
+    ])
+    paginator = KeysetPaginator(Event.objects.select_related('location').order_by('location__name', 'pk'), 3)
+    events = list(paginator.object_list)
+    page = paginator.page_around(events[2])
+    assert events[1:4] == page.object_list
+    assert page.has_previous()
+    assert page.has_next()
+
+
+@pytest.mark.skipif(
+    not connection.features.supports_slicing_ordering_in_compound,
+    reason="Database does not support UNION of LIMITed queries",
+)
+def test_page_around_single_query(django_assert_num_queries):
+    Event.objects.bulk_create([
+        Event(timestamp='2017-01-01T01:23:45Z', tag='a', reading=1),
+        Event(timestamp='2017-01-01T01:23:45Z', tag='B', reading=2),
+        Event(timestamp='2017-01-01T01:23:45Z', tag='c', reading=3),
+        Event(timestamp='2017-01-01T01:23:45Z', tag='D', reading=4),
+        Event(timestamp='2017-01-01T05:23:45Z', reading=5),
+        Event(timestamp='2017-01-01T06:23:45Z', reading=6),
+    ])
+    # The database's text collation decides the order, not python's.
+    paginator = KeysetPaginator(Event.objects.order_by('timestamp', 'tag'), 3)
+    events = list(paginator.object_list)
+
+    with django_assert_num_queries(1):
+        page = paginator.page_around(events[2], before=1, after=1)
+        assert events[1:4] == page.object_list
+    assert not any(hasattr(event, '_keyset_preceding') for event in page.object_list)
+
+    assert [events[0]] == paginator.page(page.previous_page_number()).object_list
+    assert events[4:] == paginator.page(page.next_page_number()).object_list
+
+    # Objects with NULL keys sort where the database puts them.
+    page = paginator.page_around(events[2], before=2, after=2)
+    assert events[:5] == page.object_list
+    assert not page.has_previous()
+    assert page.has_next()
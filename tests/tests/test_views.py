@@ -1,5 +1,26 @@
+from django.core.cache import caches
+
+from keyset_pagination.paginator import KeysetPaginator
+
+from ..models import Event
+from ..views import EventList
 
 
 def test_pagination_in_view(client):
     response = client.get('/events/')
     assert response.status_code == 200
+
+
+def test_numbered_pages_in_view(client):
+    caches['default'].clear()
+    Event.objects.bulk_create([
+        Event(timestamp='2017-01-01T01:23:45Z', group=str(i), reading=i) for i in range(7)
+    ])
+    KeysetPaginator(EventList.queryset, EventList.paginate_by, boundaries=True).boundaries.refresh()
+
+    response = client.get('/events/indexed/?page=2')
+    assert response.status_code == 200
+    assert response.context['page_obj'].page_index == 2
+
+    response = client.get('/events/indexed/?page=999')
+    assert response.status_code == 404
@@ -5,9 +5,11 @@ try:
     from django.urls import path
     urlpatterns = [
         path('events/', views.EventList.as_view(), name='events'),
+        path('events/indexed/', views.IndexedEventList.as_view(), name='indexed-events'),
     ]
 except ImportError:
     from django.conf.urls import url
     urlpatterns = [
         url(r'^events/$', views.EventList.as_view(), name='events'),
+        url(r'^events/indexed/$', views.IndexedEventList.as_view(), name='indexed-events'),
     ]
@@ -11,3 +11,8 @@ class EventList(PaginateMixin, ListView):
     paginate_by = 5
     template_name = 'events.html'
     queryset = Event.objects.order_by('-timestamp', 'group')
+
+
+class IndexedEventList(EventList):
+    def get_paginator(self, *args, **kwargs):
+        return super(IndexedEventList, self).get_paginator(*args, boundaries=True, **kwargs)